@@ -23,6 +23,7 @@ sanity():
     Perform a sanity check on staleness of data.
 """
 
+from functools import cache
 from pathlib import Path
 from string import Template
 
@@ -37,6 +38,16 @@ from query.aggspec import *
 SCHEMA = config.load_schema('osiris')
 
 
+@cache
+def _get_path_to_credentials() -> Path:
+    """
+    Return the path to the OSIRIS credentials from config.
+
+    The path is resolved once and cached; call `_get_path_to_credentials.cache_clear()` after changing the config at runtime.
+    """
+    return config.get_paths_from_config('osiris', table='credentials')
+
+
 quickfilter_docstrings = ['    QUICK FILTERS', *[
     utils.QUICK_FILTER_TEMPLATE.substitute(column_name = column_name)
     for column_name in ['studentnummer', 'sinh_id', 'io_aanvr_id']
@@ -72,6 +83,9 @@ def execute_query(
         Default is 'numpy_nullable'.
     - squeeze (bool):
         Return Series if output has only one column. Default is True.
+    - params (dict[str, Any] | None, optional):
+        Values for named bind parameters (`:name`) in the query.
+        Quick filters add their values here. Default is None.
     - **kwargs:
         Additional keyword arguments passed to the query definition.
 
@@ -81,11 +95,10 @@ def execute_query(
     Raises:
     - DatabaseError: If an error occurs during the query execution.
     """
-    path_to_credentials = config.get_paths_from_config('osiris', table='credentials')
     return execution.execute_query(
         query,
         connector = connection.get_oracledb_con_to_oracle_db,
-        path_to_credentials = path_to_credentials,
+        path_to_credentials = _get_path_to_credentials(),
         parse_dates = parse_dates,
         index_col = index_col,
         dtype = dtype,
@@ -124,11 +137,8 @@ def find_table(
     - pd.DataFrame: A DataFrame containing all tables meeting the specified criteria.
     """
     tpl = SEARCH_STRINGS[how]
-
-    where = [] if where is None else where
-    for arg in args:
-        criterium = tpl.substitute(field='table_name', arg=arg.upper())
-        where.append(criterium)
+    criteria = [tpl.substitute(field='table_name', arg=arg.upper()) for arg in args]
+    where = utils.combine_where(criteria, where)
 
     df = execute_query(
         'reference/all_tables',
@@ -166,23 +176,19 @@ def find_column(
     - pd.DataFrame: A DataFrame containing all columns meeting the specified criteria.
     """
     tpl = SEARCH_STRINGS[how]
-
-    where = [] if where is None else where
-    for arg in args:
-        criterium = tpl.substitute(field='column_name', arg=arg.upper())
-        where.append(criterium)
+    criteria = [tpl.substitute(field='column_name', arg=arg.upper()) for arg in args]
 
     if table:
         assert isinstance(table, str), "Table needs to be a string"
         tpl = SEARCH_STRINGS[how_table]
-        criterium = tpl.substitute(field='table_name', arg=table.upper())
-        where.append(criterium)
+        criteria.append(tpl.substitute(field='table_name', arg=table.upper()))
 
     if data_type:
         assert isinstance(data_type, str), "Data_type needs to be a string"
         tpl = SEARCH_STRINGS[how_data_type]
-        criterium = tpl.substitute(field='data_type', arg=data_type.upper())
-        where.append(criterium)
+        criteria.append(tpl.substitute(field='data_type', arg=data_type.upper()))
+
+    where = utils.combine_where(criteria, where)
 
     df = execute_query(
         'reference/all_columns',
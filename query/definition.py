@@ -1,7 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import TypeAlias
 
-from jinja2 import Environment, BaseLoader, FileSystemLoader, meta
+from jinja2 import Environment, BaseLoader, FileSystemLoader, Template, meta
 from sqlalchemy import text, TextClause
 
 import sqlparse
@@ -57,6 +58,29 @@ def get_environment(
 ENV: Environment = get_environment()
 
 
+def compile_template(env: Environment, source: str) -> Template:
+    """
+    Compile `source` into a template from `env`.
+
+    Templates compiled with the default environment (`ENV`) are cached by source, so rendering the same query again skips parsing and compiling the jinja source. Other environments are not cached, so that the cache does not keep them alive.
+
+    Parameters:
+    - env (Environment): Jinja2 environment to compile with.
+    - source (str): Template source.
+
+    Returns:
+    Template: The compiled template.
+    """
+    if env is ENV:
+        return _compile_default_template(source)
+    return env.from_string(source)
+
+
+@lru_cache(maxsize=512)
+def _compile_default_template(source: str) -> Template:
+    return ENV.from_string(source)
+
+
 UTIL_KEYWORDS: list[str] = [
     'select',
     'where',
@@ -153,7 +177,7 @@ def get_sql(
         variables = get_params(source, env=env)
         print(variables)
 
-    template = env.from_string(source)
+    template = compile_template(env, source)
     rendered = template.render(**kwargs)
 
     if any(kwd in kwargs for kwd in UTIL_KEYWORDS):
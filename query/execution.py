@@ -1,10 +1,10 @@
 from pathlib import Path
 from string import Template
-from typing import Callable
+from typing import Any, Callable
 
 import pandas as pd
 from jinja2 import Environment
-from sqlalchemy import TextClause
+from sqlalchemy import Connection, TextClause, bindparam
 from sqlalchemy.exc import DatabaseError
 from pandas.errors import DatabaseError as PandasDatabaseError
 
@@ -14,11 +14,13 @@ from query.definition import get_sql, get_params
 
 
 DEFAULT_QUERY_NAME = '<n/a>'
+ORACLE_COLLECTION_TYPE = 'SYS.ODCIVARCHAR2LIST'
 ERROR_TEMPLATE = Template("""
 Database error message: ${error_message}
 Query: ${query_name}
 Parameters: ${params}
 Missing: ${missing}
+Bound values: ${bound_values}
 ------------------------------------------------------------------------
 
 ${sql}
@@ -37,6 +39,7 @@ def execute_query(
     path_to_credentials: str | Path,
     *,
     env: Environment | None = None,
+    params: dict[str, Any] | None = None,
     parse_dates: list | dict | None = None,
     index_col: str | list[str] | None = None,
     dtype: str | dict | None = None,
@@ -56,6 +59,12 @@ def execute_query(
         Path to the credentials file or a string containing credentials.
     - env (Environment | None, optional):
         Environment context for the query execution. Default is None.
+    - params (dict[str, Any] | None, optional):
+        Values for named bind parameters (`:name`) in the query.
+        Lists and tuples are bound as expanding parameters (for `in :name`),
+        `utils.BindCollection` as one Oracle collection (for `table(:name)`).
+        Raises ValueError if the query does not use a given parameter.
+        Default is None.
     - parse_dates (list | dict | None, optional):
         Columns to parse as dates. Default is None.
     - index_col (str | list[str] | None, optional):
@@ -80,20 +89,26 @@ def execute_query(
     dtype_backend = 'numpy_nullable' if dtype_backend is None else dtype_backend
     query_name = query if definition.is_path(query) else DEFAULT_QUERY_NAME
     sql = definition.get_sql(query, env=env, **kwargs)
-    con = connection.get_connection_to_db(connector, path_to_credentials)
+    if params:
+        check_params(sql, params)
+    engine = connection.get_connection_to_db(connector, path_to_credentials)
     if index_col is None:
         index_col = kwargs.get('columns')
     elif index_col == False:
         index_col = None
     try:
-        df = pd.read_sql_query(
-            sql,
-            con,
-            parse_dates = parse_dates,
-            index_col = index_col,
-            dtype = dtype,
-            dtype_backend = dtype_backend,
-        )
+        # collections are created on the DBAPI connection the query runs on
+        with engine.connect() as con:
+            if params:
+                sql = bind_params(sql, params, con)
+            df = pd.read_sql_query(
+                sql,
+                con,
+                parse_dates = parse_dates,
+                index_col = index_col,
+                dtype = dtype,
+                dtype_backend = dtype_backend,
+            )
         if squeeze and len(df.columns) == 1:
             return df.squeeze(axis=1)
         if squeeze and len(df) == 1:
@@ -101,8 +116,8 @@ def execute_query(
         return df
 
     except (DatabaseError, PandasDatabaseError) as e:
-        params = get_params(query)
-        missing = [k for k in params if k not in kwargs]
+        query_params = get_params(query)
+        missing = [k for k in query_params if k not in kwargs]
         orig = getattr(e, 'orig', None)
 
         # needed to get info from pandas error wrapper
@@ -114,8 +129,67 @@ def execute_query(
             sql = sql.text,
             query_name = query_name,
             error_message = info,
-            params = params,
+            params = query_params,
             missing = missing,
+            bound_values = params,
         )
         print(error_statement)
         return None
+
+
+def check_params(sql: TextClause, params: dict[str, Any]) -> None:
+    """
+    Raise ValueError if `sql` does not define a parameter in `params`, e.g. when a quick filter is combined with a TextClause query (which is not wrapped, so the filter is never added).
+    """
+    defined = sql.compile().params
+    missing = [name for name in params if name not in defined]
+    if missing:
+        raise ValueError(
+            f"Query does not define bound parameter(s) {missing}. "
+            "Filters and `where` are not applied to TextClause queries."
+        )
+
+
+def bind_params(
+    sql: TextClause,
+    params: dict[str, Any],
+    con: Connection | None = None,
+) -> TextClause:
+    """
+    Bind values to the named parameters in `sql`.
+
+    `utils.BindCollection` values are bound as a single Oracle collection (`SYS.ODCIVARCHAR2LIST`) created on the DBAPI connection of `con`, for use as `in (select column_value from table(:name))`. The query text is the same for any number of values, so Oracle parses it once and reuses the plan.
+
+    Other lists and tuples are bound as expanding parameters: at execution `column in :name` is rendered as `column in (:name_1, :name_2, ...)` with one bind parameter per value. The values are never inlined in the query text, but the text varies with the number of values.
+
+    Parameters:
+    - sql (TextClause): SQL query containing named bind parameters.
+    - params (dict[str, Any]): Mapping of parameter names to values.
+    - con (Connection | None, optional): Oracle connection the query will be executed on. Required for BindCollection values. Default is None.
+
+    Returns:
+    - TextClause: The SQL query with the values bound.
+
+    Raises:
+    - ValueError: If `sql` does not define a parameter in `params`, or a BindCollection is bound without an Oracle connection.
+    """
+    check_params(sql, params)
+    binds = []
+    for name, value in params.items():
+        if isinstance(value, utils.BindCollection):
+            binds.append(bindparam(name, to_collection(value, con)))
+        else:
+            expanding = isinstance(value, (list, tuple))
+            binds.append(bindparam(name, value, expanding=expanding))
+    return sql.bindparams(*binds)
+
+
+def to_collection(values: utils.BindCollection, con: Connection | None) -> Any:
+    """
+    Create a `SYS.ODCIVARCHAR2LIST` holding `values` on the DBAPI connection of `con`.
+    """
+    if con is None or con.dialect.name != 'oracle':
+        raise ValueError("Collection parameters require an Oracle connection.")
+    dbapi_con = con.connection.driver_connection
+    collection_type = dbapi_con.gettype(ORACLE_COLLECTION_TYPE)
+    return collection_type.newobject([str(value) for value in values])
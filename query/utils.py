@@ -1,27 +1,39 @@
 import io
+import os
 from string import Template
 from functools import wraps
 from typing import Any, BinaryIO, Callable
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 
 class DotDict(dict):
-    __getattr__ = dict.__getitem__
+    """
+    Dictionary with attribute access to its keys.
+
+    Attribute lookups go through the dict; for fixed sets of names read on hot paths, prefer `types.SimpleNamespace`.
+    """
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
-    __dir__ = dict.keys
+
+    def __dir__(self):
+        return list(self.keys())
 
 
 # region docstring
-DOCSTRING_TEMPLATE = Template(
-"""$docstring
+DOCSTRING_TEMPLATE = """{docstring}
 
 Additional notes
 ----------------
-$appendices"""
-)
+{appendices}"""
 
 
 def add_to_docstring(*appendices: str) -> Callable:
@@ -34,15 +46,14 @@ def add_to_docstring(*appendices: str) -> Callable:
     Returns:
     - callable: Decorated function.
     """
+    joined = '\n'.join(appendices)
+
     def decorator(func):
-        func.__doc__ = DOCSTRING_TEMPLATE.substitute(
+        func.__doc__ = DOCSTRING_TEMPLATE.format(
             docstring = func.__doc__,
-            appendices = '\n'.join(appendices)
+            appendices = joined
         )
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        return wrapper
+        return func
     return decorator
 
 
@@ -76,12 +87,37 @@ def add_keyword_defaults(keywords: dict[str, Any]) -> Callable:
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            kwargs = keywords | kwargs
-            return func(*args, **kwargs)
+            if not kwargs:
+                return func(*args, **keywords)
+            return func(*args, **(keywords | kwargs))
         return wrapper
     return decorator
 
 
+# region where
+def combine_where(
+    criteria: list[str],
+    where: list | str | None = None,
+) -> list[str]:
+    """
+    Combine criteria with an optional `where` argument into a single list.
+
+    The `where` argument passed by the caller is copied, never modified.
+
+    Parameters:
+    - criteria (list[str]): Criteria to add.
+    - where (list|str|None): Existing conditions. Defaults to None.
+
+    Returns:
+    - list[str]: Existing conditions followed by `criteria`.
+    """
+    if where is None:
+        return list(criteria)
+    if isinstance(where, str):
+        return [where, *criteria]
+    return [*where, *criteria]
+
+
 # region quickfilter
 QUICK_FILTER_TEMPLATE = Template(
 """    - $column_name (str|list|None):
@@ -89,11 +125,20 @@ QUICK_FILTER_TEMPLATE = Template(
 )
 
 
+class BindCollection(tuple):
+    """Values to bind as one collection parameter instead of one parameter per value.
+
+    Used with `in (select column_value from table(:name))`. On Oracle the values are bound as a single `SYS.ODCIVARCHAR2LIST` (see `execution.bind_params`), so the query text is the same for any number of values and the database reuses one plan. Values are bound as strings.
+    """
+
+
 def add_quick_filter(column_name: str) -> Callable:
     """Create a decorator that adds SQL-style IN clause filtering for a specified column.
 
     This decorator allows functions to accept an additional keyword argument (named by column_name) which gets transformed into a SQL-style IN clause and added to the 'where' parameter of the decorated function.
 
+    The values are not formatted into the SQL. Instead the clause refers to a named bind parameter (`:column_name`) and the values are added to the 'params' parameter of the decorated function. Multiple values are bound as one Oracle collection (`in (select column_value from table(:column_name))`, see `BindCollection`), so the query text does not depend on the number of values and the 1000 expression limit of IN lists does not apply. A single value is compared with `=` instead. Values are converted to strings, so the column is compared as text and its index stays usable.
+
     Parameters
     ----------
     column_name : str
@@ -109,14 +154,22 @@ def add_quick_filter(column_name: str) -> Callable:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             key: str | list[str] | None = kwargs.pop(column_name, None)
             if key is not None:
-                keys = [key] if isinstance(key, str) else key
-                keys_as_string = ', '.join(f"'{n}'" for n in keys)
-                formatted = f"{column_name} in ({keys_as_string})"
-
-                where = kwargs.get('where', [])
-                where = [where] if isinstance(where, str) else list(where)
-                where.append(formatted)
-                kwargs['where'] = where
+                keys = [key] if isinstance(key, str) else [str(k) for k in key]
+                if len(keys) == 1:
+                    formatted = f"{column_name} = :{column_name}"
+                    value = keys[0]
+                else:
+                    formatted = (
+                        f"{column_name} in "
+                        f"(select column_value from table(:{column_name}))"
+                    )
+                    value = BindCollection(keys)
+
+                kwargs['where'] = combine_where([formatted], kwargs.get('where'))
+
+                params = dict(kwargs.get('params') or {})
+                params[column_name] = value
+                kwargs['params'] = params
 
             return func(*args, **kwargs)
         return wrapper
@@ -136,15 +189,35 @@ class ExcelExporter:
         Format string for dates, by default 'DD-MM-YYYY'
     datetime_format : str, optional
         Format string for datetime values, by default 'DD-MM-YYYY'
+    backend : str, optional
+        One of 'pandas' (write with `DataFrame.to_excel`) or 'polars' (write
+        with `polars.DataFrame.write_excel`, faster for large frames but
+        limited to single-level columns), by default 'pandas'
     """
 
+    # skip per-cell scanning of strings for urls and formulas
+    WORKBOOK_OPTIONS = {
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    }
+    COLUMN_PADDING = 2
+    MAX_COLUMN_WIDTH = 255
+    # column widths are measured on at most this many values per column
+    WIDTH_SAMPLE_ROWS = 1000
+    # decimals shown for floats, as in Excel's General format
+    FLOAT_DIGITS = 10
+
     def __init__(
         self,
         date_format: str = 'DD-MM-YYYY',
         datetime_format: str = 'DD-MM-YYYY',
+        backend: str = 'pandas',
     ):
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: '{backend}'. Use 'pandas' or 'polars'.")
         self.date_format = date_format
         self.datetime_format = datetime_format
+        self.backend = backend
 
     def _header_row_count(self, df: pd.DataFrame, index: bool) -> int:
         """Return the number of header rows pandas writes.
@@ -158,6 +231,80 @@ class ExcelExporter:
             return col_nlevels + 1
         return col_nlevels
 
+    def _sheet_layout(
+        self,
+        df: pd.DataFrame,
+        index: bool,
+    ) -> tuple[int, int, int, int]:
+        """Return the layout of a sheet as written by pandas.
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            Number of rows, number of columns, number of index columns (0 if
+            index is not shown) and number of header rows
+        """
+        n_rows, n_cols = df.shape
+        idx_nlevels = df.index.nlevels if index else 0
+        header_rows = self._header_row_count(df, index)
+        return n_rows, n_cols, idx_nlevels, header_rows
+
+    def _value_width(self, values: pd.Index | pd.Series) -> int:
+        """Return the width of the longest value as displayed in Excel.
+
+        Missing values are skipped (Excel shows an empty cell). Integers are
+        measured from their extremes and string dtype columns in full, as both
+        are vectorized. Object and float columns are measured from the first
+        `WIDTH_SAMPLE_ROWS` values, with floats rounded to `FLOAT_DIGITS`
+        decimals instead of measuring their full repr.
+        """
+        dtype = values.dtype
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return len(self.datetime_format)
+        if pd.api.types.is_bool_dtype(dtype):
+            return len('FALSE')
+
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return 0
+        if pd.api.types.is_integer_dtype(dtype):
+            return max(len(str(values.min())), len(str(values.max())))
+        if dtype != object and pd.api.types.is_string_dtype(dtype):
+            return int(values.str.len().max())
+
+        sample = values.iloc[:self.WIDTH_SAMPLE_ROWS]
+        if pd.api.types.is_float_dtype(dtype):
+            sample = sample.round(self.FLOAT_DIGITS)
+        return int(sample.astype(str).str.len().max())
+
+    def _column_widths(self, df: pd.DataFrame, index: bool) -> np.ndarray:
+        """Return the column widths for a sheet, index columns first.
+
+        Widths are based on the longest header label and value per column
+        (see `_value_width`) instead of letting the worksheet walk every
+        written cell.
+        """
+        header_widths = [
+            max(len(str(part)) for part in (label if isinstance(label, tuple) else (label,)))
+            for label in df.columns
+        ]
+        value_widths = [self._value_width(df.iloc[:, i]) for i in range(df.shape[1])]
+        widths = np.maximum(header_widths, value_widths)
+
+        if index:
+            idx_widths = [
+                max(len(str(name or '')), self._value_width(df.index.get_level_values(i)))
+                for i, name in enumerate(df.index.names)
+            ]
+            widths = np.concatenate([idx_widths, widths])
+
+        return np.minimum(widths + self.COLUMN_PADDING, self.MAX_COLUMN_WIDTH)
+
+    def _set_column_widths(self, sheet: object, widths: np.ndarray) -> None:
+        """Set the width of each column on a worksheet, starting at column 0."""
+        for i, width in enumerate(widths):
+            sheet.set_column(i, i, int(width))
+
     def _format_sheet(
         self,
         sheet: object,
@@ -165,6 +312,7 @@ class ExcelExporter:
         idx_offset: int,
         n_rows: int,
         n_cols: int,
+        widths: np.ndarray,
     ) -> None:
         """Apply formatting to a worksheet.
 
@@ -180,8 +328,10 @@ class ExcelExporter:
             Number of rows
         n_cols : int
             Number of columns
+        widths : np.ndarray
+            Width per column, index columns first
         """
-        sheet.autofit()
+        self._set_column_widths(sheet, widths)
         sheet.autofilter(
             col_nlevels - 1,
             0,
@@ -273,15 +423,19 @@ class ExcelExporter:
         index : bool, optional
             Whether to write index to Excel file, by default True
         """
+        if self.backend == 'polars':
+            self._write_polars(sheet_data, destination, index=index)
+            return
+
         with pd.ExcelWriter(
             destination,
+            engine='xlsxwriter',
             date_format=self.date_format,
             datetime_format=self.datetime_format,
+            engine_kwargs={'options': self.WORKBOOK_OPTIONS},
         ) as writer:
             for sheet_name, df in sheet_data.items():
-                n_rows, n_cols = df.shape
-                idx_nlevels = df.index.nlevels if index else 0
-                header_rows = self._header_row_count(df, index)
+                n_rows, n_cols, idx_nlevels, header_rows = self._sheet_layout(df, index)
 
                 df.to_excel(
                     writer,
@@ -296,15 +450,96 @@ class ExcelExporter:
                     idx_nlevels,
                     n_rows,
                     n_cols,
+                    self._column_widths(df, index),
+                )
+
+    def _polars_frame(self, df: pd.DataFrame, index: bool) -> pd.DataFrame:
+        """Return `df` with string column names and the index as columns.
+
+        pandas leaves the header of an unnamed index blank. polars writes an
+        Excel table, which needs unique non-empty headers, so unnamed index
+        levels get a header of spaces instead of 'index' or 'level_0'.
+        """
+        if not index:
+            return df.rename(columns=str)
+        index_names = [
+            ' ' * (i + 1) if name is None else name
+            for i, name in enumerate(df.index.names)
+        ]
+        data = df.reset_index()
+        data.columns = [str(name) for name in [*index_names, *df.columns]]
+        return data
+
+    def _write_polars(
+        self,
+        sheet_data: dict[str, pd.DataFrame],
+        destination: Path | BinaryIO,
+        index: bool = True,
+    ) -> None:
+        """Write sheet data with polars to a file path or file-like object.
+
+        Parameters
+        ----------
+        destination : Path | BinaryIO
+            File path or file-like object to write to
+        sheet_data : dict[str, pd.DataFrame]
+            Dictionary mapping sheet names to DataFrames
+        index : bool, optional
+            Whether to write index to Excel file, by default True
+
+        Raises
+        ------
+        ValueError
+            If a DataFrame has multi-level columns
+        """
+        import polars as pl
+        from xlsxwriter import Workbook
+
+        if isinstance(destination, Path):
+            destination = str(destination)
+
+        # numbers in the General format like pandas, instead of polars' defaults
+        numeric_dtypes = [
+            pl.Int8, pl.Int16, pl.Int32, pl.Int64,
+            pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64,
+            pl.Float32, pl.Float64,
+        ]
+        dtype_formats = {
+            **{dtype: 'General' for dtype in numeric_dtypes},
+            pl.Date: self.date_format,
+            pl.Datetime: self.datetime_format,
+        }
+        with Workbook(destination, self.WORKBOOK_OPTIONS) as workbook:
+            for sheet_name, df in sheet_data.items():
+                if df.columns.nlevels > 1:
+                    raise ValueError(
+                        f"Sheet '{sheet_name}': polars backend does not "
+                        "support multi-level columns, use backend='pandas'"
+                    )
+                _, _, idx_nlevels, _ = self._sheet_layout(df, index)
+                data = self._polars_frame(df, index)
+                pl.from_pandas(data).write_excel(
+                    workbook,
+                    worksheet=sheet_name,
+                    dtype_formats=dtype_formats,
+                    table_style={'style': 'None', 'banded_rows': False},
+                    autofilter=True,
+                    freeze_panes=(1, idx_nlevels),
+                )
+                # size columns the same way as the pandas backend
+                self._set_column_widths(
+                    workbook.get_worksheet_by_name(sheet_name),
+                    self._column_widths(df, index),
                 )
 
 
 # region other
+NOTEBOOK_FOLDERS = ('queries', 'output', 'data')
+
+
 def init_notebook_folder():
-    from pathlib import Path
-    path = Path()
-    for folder in ['queries', 'output', 'data']:
-        (path / folder).mkdir(exist_ok=True)
+    for folder in NOTEBOOK_FOLDERS:
+        os.makedirs(folder, exist_ok=True)
 
 
 class Ts:
@@ -332,5 +567,19 @@ class Ts:
     def now(self):
         return pd.Timestamp.today()
 
+    def snapshot(self) -> 'TsSnapshot':
+        """Return timestamps frozen at the current moment."""
+        return TsSnapshot(self.now)
+
+
+class TsSnapshot(Ts):
+    """Ts frozen at a single moment; all properties format the same instant."""
+    def __init__(self, now: pd.Timestamp):
+        self._now = now
+
+    @property
+    def now(self):
+        return self._now
+
 
 TS = Ts()
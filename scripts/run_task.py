@@ -1,5 +1,6 @@
 import argparse
 import json
+import os
 
 from importlib import import_module
 from pathlib import Path
@@ -36,9 +37,8 @@ def path_to_json(path: Path|str) -> dict[str, Any]:
     if not path.exists() or not path.is_file():
         raise FileNotFoundError(f"File '{path}' does not exist/is not a file.")
 
-    with open(path, 'r') as file:
-        file_content = file.read()
-        return json.loads(file_content)
+    with open(path, 'rb') as file:
+        return json.load(file)
 
 
 def make_out_path() -> Path:
@@ -51,7 +51,23 @@ def run_query(
     **task
 ) -> pd.DataFrame:
     df = source.execute_query(**task)
-    df.to_parquet(out_path)
+    # write under a temporary name and move into place, so a waiting
+    # reader never sees a partially written file
+    out_path = Path(out_path)
+    temp_path = out_path.with_name(f".{out_path.name}.partial")
+    try:
+        # temp file is read back once right away: favour speed over size
+        df.to_parquet(
+            temp_path,
+            engine='pyarrow',
+            compression='lz4',
+            row_group_size=max(len(df), 1),
+            use_dictionary=True,
+        )
+        os.replace(temp_path, out_path)
+    finally:
+        # only left behind if writing or moving failed
+        temp_path.unlink(missing_ok=True)
     return df
 
 
@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from query.execution import ORACLE_COLLECTION_TYPE, bind_params
+from query.utils import BindCollection
+
+
+class TestBindParams(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine('sqlite://')
+        df = pd.DataFrame({'studentnummer': ['1', '2', '3'], 'n': [1, 2, 3]})
+        df.to_sql('t', self.engine, index=False)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def query(self, sql: str, **params) -> pd.DataFrame:
+        bound = bind_params(text(sql), params)
+        return pd.read_sql_query(bound, self.engine)
+
+    def test_list_is_expanded(self) -> None:
+        """Test that a list is bound as an expanding IN parameter"""
+        df = self.query(
+            "select n from t where studentnummer in :studentnummer order by n",
+            studentnummer=['1', '3'],
+        )
+        self.assertEqual(df['n'].tolist(), [1, 3])
+
+    def test_scalar(self) -> None:
+        """Test that a scalar is bound as a regular parameter"""
+        df = self.query(
+            "select n from t where studentnummer = :studentnummer",
+            studentnummer='2',
+        )
+        self.assertEqual(df['n'].tolist(), [2])
+
+    def test_values_are_not_inlined(self) -> None:
+        """Test that values containing quotes are bound, not formatted"""
+        df = self.query(
+            "select n from t where studentnummer in :studentnummer",
+            studentnummer=["1' or '1' = '1"],
+        )
+        self.assertTrue(df.empty)
+
+    def test_undefined_parameter(self) -> None:
+        """Test that binding a parameter the query does not use raises"""
+        with self.assertRaises(ValueError):
+            bind_params(text("select * from t"), {'studentnummer': ['1']})
+
+    def test_collection_requires_oracle(self) -> None:
+        """Test that a collection cannot be bound on another database"""
+        sql = text("select n from t where studentnummer in (select column_value from table(:s))")
+        with self.engine.connect() as con:
+            with self.assertRaises(ValueError):
+                bind_params(sql, {'s': BindCollection(['1'])}, con)
+
+
+class TestBindCollection(unittest.TestCase):
+    def test_collection_is_one_parameter(self) -> None:
+        """Test that a collection is created on the DBAPI connection and bound once"""
+        con = mock.Mock()
+        con.dialect.name = 'oracle'
+        dbapi_con = con.connection.driver_connection
+        dbapi_con.gettype.return_value.newobject.side_effect = lambda values: ('obj', values)
+
+        sql = text("select * from t where s in (select column_value from table(:s))")
+        bound = bind_params(sql, {'s': BindCollection(['1', '2', '3'])}, con)
+
+        dbapi_con.gettype.assert_called_once_with(ORACLE_COLLECTION_TYPE)
+        self.assertEqual(bound.compile().params, {'s': ('obj', ['1', '2', '3'])})
+        self.assertEqual(str(bound), str(sql))
+
+
+if __name__ == '__main__':
+    unittest.main()
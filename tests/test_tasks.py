@@ -0,0 +1,86 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils import tasks
+
+
+CONTENT = b'x' * 1000
+
+
+def write_and_replace(path: Path, delay: float = 0.3) -> None:
+    """Write to a temporary name and move it into place."""
+    time.sleep(delay)
+    temp_path = path.with_name(f".{path.name}.partial")
+    temp_path.write_bytes(CONTENT)
+    os.replace(temp_path, path)
+
+
+class SilentObserver:
+    """Observer that never delivers events, like on a network mount."""
+    def schedule(self, *args, **kwargs): pass
+    def start(self): pass
+    def stop(self): pass
+    def join(self): pass
+
+
+class TestWaitForFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / 'temp.parquet'
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def wait_while(self, writer, **kwargs) -> Path:
+        thread = threading.Thread(target=writer, args=(self.path,))
+        thread.start()
+        try:
+            return tasks.wait_for_file(self.path, **kwargs)
+        finally:
+            thread.join()
+
+    @unittest.skipIf(tasks.Observer is None, "watchdog not installed")
+    def test_moved_into_place(self) -> None:
+        """Test that a file moved into place is picked up"""
+        result = self.wait_while(write_and_replace, timeout_seconds=5)
+        self.assertEqual(result, self.path)
+        self.assertEqual(self.path.read_bytes(), CONTENT)
+
+    @unittest.skipIf(tasks.Observer is None, "watchdog not installed")
+    def test_returns_on_event(self) -> None:
+        """Test that a notification ends the wait before the next check"""
+        start = time.time()
+        self.wait_while(lambda path: write_and_replace(path, delay=0.1), timeout_seconds=5)
+        self.assertLess(time.time() - start, 0.9)
+
+    @unittest.skipIf(tasks.Observer is None, "watchdog not installed")
+    def test_without_events(self) -> None:
+        """Test that the file is found at the next check when no notifications arrive"""
+        start = time.time()
+        with mock.patch.object(tasks, 'Observer', SilentObserver):
+            self.wait_while(lambda path: write_and_replace(path, delay=0.1), timeout_seconds=5)
+        self.assertLess(time.time() - start, 1.5)
+        self.assertEqual(self.path.read_bytes(), CONTENT)
+
+    def test_without_watchdog(self) -> None:
+        """Test polling fallback when watchdog is not installed"""
+        with mock.patch.object(tasks, 'Observer', None):
+            self.wait_while(write_and_replace, timeout_seconds=5)
+        self.assertEqual(self.path.read_bytes(), CONTENT)
+
+    def test_timeout(self) -> None:
+        """Test that a missing file raises TimeoutError"""
+        for observer in [tasks.Observer, SilentObserver, None]:
+            with self.subTest(observer=observer):
+                with mock.patch.object(tasks, 'Observer', observer):
+                    with self.assertRaises(TimeoutError):
+                        tasks.wait_for_file(self.path, timeout_seconds=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import importlib.util
+import io
+import unittest
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from query.utils import (
+    DotDict,
+    ExcelExporter,
+    add_keyword_defaults,
+    BindCollection,
+    add_quick_filter,
+    combine_where,
+)
+
+
+class TestDotDict(unittest.TestCase):
+    def test_attribute_access(self) -> None:
+        """Test that keys are accessible as attributes"""
+        d = DotDict(a=1)
+        d.b = 2
+        self.assertEqual(d.a, 1)
+        self.assertEqual(d['b'], 2)
+
+    def test_missing_attribute(self) -> None:
+        """Test that a missing key raises AttributeError"""
+        d = DotDict(a=1)
+        self.assertFalse(hasattr(d, 'b'))
+        self.assertIsNone(getattr(d, 'b', None))
+        with self.assertRaises(AttributeError):
+            d.b
+
+    def test_dir_lists_keys(self) -> None:
+        """Test that dir returns the keys"""
+        self.assertEqual(dir(DotDict(b=1, a=2)), ['a', 'b'])
+
+
+class TestAddKeywordDefaults(unittest.TestCase):
+    def setUp(self) -> None:
+        @add_keyword_defaults({'a': 1, 'b': 2})
+        def test_func(**kwargs: Any) -> dict[str, Any]:
+            return kwargs
+        self.test_func = test_func
+
+    def test_defaults(self) -> None:
+        """Test that defaults are used when no keywords are passed"""
+        self.assertEqual(self.test_func(), {'a': 1, 'b': 2})
+
+    def test_override(self) -> None:
+        """Test that passed keywords override defaults"""
+        self.assertEqual(self.test_func(b=3, c=4), {'a': 1, 'b': 3, 'c': 4})
+
+
+class TestCombineWhere(unittest.TestCase):
+    def test_none(self) -> None:
+        """Test that criteria are returned as a new list without where"""
+        criteria = ["a = 1"]
+        result = combine_where(criteria)
+        self.assertEqual(result, ["a = 1"])
+        self.assertIsNot(result, criteria)
+
+    def test_string(self) -> None:
+        """Test that a string where is combined with the criteria"""
+        self.assertEqual(combine_where(["a = 1"], "b = 2"), ["b = 2", "a = 1"])
+
+    def test_list_is_not_modified(self) -> None:
+        """Test that the caller's where list is left unchanged"""
+        where = ["b = 2"]
+        result = combine_where(["a = 1"], where)
+        self.assertEqual(result, ["b = 2", "a = 1"])
+        self.assertEqual(where, ["b = 2"])
+
+
+class TestAddQuickFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        @add_quick_filter('studentnummer')
+        def test_func(**kwargs: Any) -> dict[str, Any]:
+            return kwargs
+        self.test_func = test_func
+
+    def test_no_filter(self) -> None:
+        """Test that kwargs pass through unchanged without a filter value"""
+        result = self.test_func(where="a = 1")
+        self.assertEqual(result, {'where': "a = 1"})
+
+    IN_CLAUSE = "studentnummer in (select column_value from table(:studentnummer))"
+
+    def test_list_is_bound(self) -> None:
+        """Test that a list of keys is bound as one collection, not formatted"""
+        result = self.test_func(studentnummer=['1', '2'])
+        self.assertEqual(result['where'], [self.IN_CLAUSE])
+        self.assertIsInstance(result['params']['studentnummer'], BindCollection)
+        self.assertEqual(result['params'], {'studentnummer': ('1', '2')})
+
+    def test_values_are_strings(self) -> None:
+        """Test that non-string keys are bound as strings"""
+        result = self.test_func(studentnummer=[1, 2])
+        self.assertEqual(result['params'], {'studentnummer': ('1', '2')})
+
+    def test_single_key_is_bound_as_scalar(self) -> None:
+        """Test that a single key is compared with equality"""
+        for key in ['1', ['1']]:
+            with self.subTest(key=key):
+                result = self.test_func(studentnummer=key)
+                self.assertEqual(result['where'], ["studentnummer = :studentnummer"])
+                self.assertEqual(result['params'], {'studentnummer': '1'})
+
+    def test_existing_where_and_params(self) -> None:
+        """Test that existing where and params are extended, not replaced"""
+        result = self.test_func(
+            studentnummer=['1', '2'],
+            where="a = 1",
+            params={'other': 3},
+        )
+        self.assertEqual(result['where'], ["a = 1", self.IN_CLAUSE])
+        self.assertEqual(result['params'], {'other': 3, 'studentnummer': ('1', '2')})
+
+
+class TestExcelExporterColumnWidths(unittest.TestCase):
+    def setUp(self) -> None:
+        self.exporter = ExcelExporter()
+        self.padding = ExcelExporter.COLUMN_PADDING
+
+    def widths(self, df: pd.DataFrame, index: bool = False) -> list[int]:
+        return [int(w) - self.padding for w in self.exporter._column_widths(df, index)]
+
+    def test_float_width_uses_displayed_value(self) -> None:
+        """Test that floats are not measured by their full repr"""
+        df = pd.DataFrame({'x': [0.1 + 0.2]})
+        self.assertEqual(self.widths(df), [len('0.3')])
+
+    def test_missing_values_are_skipped(self) -> None:
+        """Test that NaN/NA do not count as 'nan'/'<NA>'"""
+        df = pd.DataFrame({
+            'x': [1.5, np.nan],
+            'y': pd.array([1, None], dtype='Int64'),
+            'z': ['a', None],
+        })
+        self.assertEqual(self.widths(df), [len('1.5'), 1, 1])
+
+    def test_string_dtype_is_measured_in_full(self) -> None:
+        """Test that a long string after the sampled rows is measured"""
+        rows = ExcelExporter.WIDTH_SAMPLE_ROWS
+        values = ['a'] * rows + ['a' * 50]
+        for dtype in ['string', 'string[pyarrow]']:
+            with self.subTest(dtype=dtype):
+                df = pd.DataFrame({'x': pd.array(values, dtype=dtype)})
+                self.assertEqual(self.widths(df), [50])
+
+    def test_header_and_index(self) -> None:
+        """Test that header labels and index values are measured"""
+        df = pd.DataFrame({'long_header': [1]}, index=pd.Index(['idx_value'], name='i'))
+        self.assertEqual(self.widths(df, index=True), [len('idx_value'), len('long_header')])
+
+    def test_datetime_uses_format(self) -> None:
+        """Test that datetimes are measured by the display format"""
+        df = pd.DataFrame({'d': pd.to_datetime(['2020-01-01 12:00'])})
+        self.assertEqual(self.widths(df), [len(self.exporter.datetime_format)])
+
+
+@unittest.skipIf(importlib.util.find_spec('polars') is None, "polars not installed")
+class TestExcelExporterPolars(unittest.TestCase):
+    def export(self, df: pd.DataFrame, backend: str) -> Any:
+        from openpyxl import load_workbook
+        data = ExcelExporter(backend=backend).to_bytes(df)
+        return load_workbook(io.BytesIO(data))['data']
+
+    def test_matches_pandas_backend(self) -> None:
+        """Test that numbers, widths and the index header match the pandas backend"""
+        df = pd.DataFrame({'x': [1234567.5], 'n': [1234567]})
+        sheets = {backend: self.export(df, backend) for backend in ['pandas', 'polars']}
+        for backend, sheet in sheets.items():
+            with self.subTest(backend=backend):
+                self.assertFalse((sheet['A1'].value or '').strip())
+                self.assertEqual(sheet['B2'].number_format, 'General')
+                self.assertEqual(sheet['C2'].number_format, 'General')
+        for col in 'ABC':
+            self.assertEqual(
+                sheets['polars'].column_dimensions[col].width,
+                sheets['pandas'].column_dimensions[col].width,
+            )
+
+    def test_no_table_style(self) -> None:
+        """Test that the table is written without a table style"""
+        sheet = self.export(pd.DataFrame({'x': [1]}), 'polars')
+        table, = sheet.tables.values()
+        self.assertIsNone(table.tableStyleInfo.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,81 @@
 import json
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-from query import get_paths_from_config
+from query.config import get_paths_from_config
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
 
 
 def wait_for_file(file_path: Path|str, timeout_seconds: int = 60) -> Path:
     """
     Waits for a file to appear at the specified path.
 
+    Uses filesystem notifications (watchdog) to return as soon as the file is created or moved into place. Because notifications are not delivered on every filesystem (e.g. network mounts), the path is also checked once per second as in `poll_for_file`. Falls back to polling only if watchdog is not installed or the parent directory does not exist.
+
+    The file is returned as soon as it exists: `run_task` writes the output under a temporary name and moves it into place, so it is complete when it appears.
+
+    Parameters:
+        - file_path (Path|str): Path to file.
+        - timeout_seconds (int): Maximum time to wait (default is 60 seconds).
+
+    Returns:
+        - Path: awaited path to file.
+
+    Raises:
+        - TimeoutError: If file does not appear within specified timeout.
+    """
+    file_path = Path(file_path)
+    if Observer is None or not file_path.parent.is_dir():
+        return poll_for_file(file_path, timeout_seconds)
+
+    appeared = threading.Event()
+
+    def is_target(path: str|bytes) -> bool:
+        return os.path.basename(os.fsdecode(path)) == file_path.name
+
+    class Handler(FileSystemEventHandler):
+        def on_created(self, event: FileSystemEvent) -> None:
+            if is_target(event.src_path):
+                appeared.set()
+
+        def on_moved(self, event: FileSystemEvent) -> None:
+            if is_target(event.dest_path):
+                appeared.set()
+
+    observer = Observer()
+    observer.schedule(Handler(), str(file_path.parent), recursive=False)
+    observer.start()
+    try:
+        start_time = time.time()
+        while True:
+            # also checked without notification, for filesystems that do not deliver them
+            if file_path.exists():
+                return file_path
+            remaining = timeout_seconds - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            appeared.wait(min(1, remaining))
+    finally:
+        observer.stop()
+        observer.join()
+
+    raise TimeoutError(f"Timeout waiting for '{file_path}'")
+
+
+def poll_for_file(file_path: Path|str, timeout_seconds: int = 60) -> Path:
+    """
+    Waits for a file to appear at the specified path by checking once per second.
+
     Parameters:
         - file_path (Path|str): Path to file.
         - timeout_seconds (int): Maximum time to wait (default is 60 seconds).
@@ -22,6 +86,7 @@ def wait_for_file(file_path: Path|str, timeout_seconds: int = 60) -> Path:
     Raises:
         - TimeoutError: If file does not appear within specified timeout.
     """
+    file_path = Path(file_path)
     start_time = time.time()
 
     while time.time() - start_time < timeout_seconds:
@@ -58,7 +123,7 @@ def execute_from_task(**task: Any) -> pd.DataFrame:
 
     try:
         wait_for_file(out_path)
-        return pd.read_parquet(out_path)
+        return pd.read_parquet(out_path, engine='pyarrow', use_threads=True)
     finally:
         task_path.unlink()
         out_path.unlink()